@@ -2,12 +2,15 @@
 SentimentFi — Blockchain Module
 =================================
 Web3.py interface for interacting with the SentimentOracle contract on Monad Testnet.
-Loads ABI from Hardhat compilation artifacts automatically.
+The contract ABI is embedded below as a Python literal (SENTIMENT_ORACLE_ABI),
+so no Hardhat artifact is read at runtime.
 
 ⚠️ MONAD REQUIREMENT: All transactions use gasPrice >= 100 gwei.
 """
 
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -29,6 +32,19 @@ def _cfg():
     }
 
 
+def _receipt_poll_latency() -> float:
+    """
+    Seconds between receipt polls in push_onchain, from RECEIPT_POLL_LATENCY.
+    Monad blocks land ~every second, so polling faster than that only burns
+    RPC quota. Empty or invalid values fall back to 1.0.
+    """
+    try:
+        latency = float(os.getenv("RECEIPT_POLL_LATENCY", ""))
+    except ValueError:
+        return 1.0
+    return latency if latency > 0 else 1.0
+
+
 # Hardcoded ABI — no Hardhat artifact file needed on Streamlit Cloud
 SENTIMENT_ORACLE_ABI = [
     {
@@ -67,21 +83,59 @@ SENTIMENT_ORACLE_ABI = [
 ]
 
 
+# Web3 / contract instances are reused across calls. They are keyed by the
+# configured RPC URL and contract address, so a changed .env still takes effect.
+_web3_cache: dict[str, Web3] = {}
+_contract_cache: dict[tuple[str, str], object] = {}
+_chain_id_cache: dict[str, int] = {}
+_cache_lock = threading.Lock()
+
+
 def _get_web3() -> Web3:
-    """Return a Web3 instance connected to Monad Testnet."""
+    """
+    Return a (cached) Web3 instance for Monad Testnet.
+
+    No connectivity probe is made here — if the node is down, the caller's
+    first real RPC fails with the same error. Use check_connection() for an
+    explicit health check.
+    """
     rpc_url = _cfg()["rpc_url"]
-    w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 10}))
-    try:
-        _ = w3.eth.block_number
-    except Exception as e:
-        raise ConnectionError(f"Cannot connect to Monad RPC at {rpc_url}: {e}")
+    with _cache_lock:
+        w3 = _web3_cache.get(rpc_url)
+        if w3 is None:
+            w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 10}))
+            _web3_cache[rpc_url] = w3
     return w3
 
 
+def _get_chain_id(w3: Web3) -> int:
+    """Return the chain ID for w3's RPC URL, fetched once and then cached."""
+    key = w3.provider.endpoint_uri
+    with _cache_lock:
+        chain_id = _chain_id_cache.get(key)
+    if chain_id is None:
+        chain_id = w3.eth.chain_id
+        with _cache_lock:
+            _chain_id_cache[key] = chain_id
+    return chain_id
+
+
+@lru_cache(maxsize=8)
+def _checksum_address(address: str) -> str:
+    """Memoized Web3.to_checksum_address (keccak256 per call otherwise)."""
+    return Web3.to_checksum_address(address)
+
+
 def _get_contract(w3: Web3):
-    """Load the SentimentOracle contract instance."""
-    address = Web3.to_checksum_address(_cfg()["contract_address"])
-    return w3.eth.contract(address=address, abi=SENTIMENT_ORACLE_ABI)
+    """Load the (cached) SentimentOracle contract instance."""
+    address = _checksum_address(_cfg()["contract_address"])
+    key = (w3.provider.endpoint_uri, address)
+    with _cache_lock:
+        contract = _contract_cache.get(key)
+        if contract is None:
+            contract = w3.eth.contract(address=address, abi=SENTIMENT_ORACLE_ABI)
+            _contract_cache[key] = contract
+    return contract
 
 
 def push_onchain(token: str, score: float) -> str:
@@ -97,20 +151,32 @@ def push_onchain(token: str, score: float) -> str:
     account = w3.eth.account.from_key(cfg["private_key"])
 
     score_int = int(score * 100)  # e.g. 0.75 → 75
-    nonce = w3.eth.get_transaction_count(account.address)
+    # nonce / gas / chainId are given up front so build_transaction makes no
+    # RPCs of its own; the placeholders are replaced below.
     tx = contract.functions.updateSentiment(token, score_int).build_transaction(
         {
             "from": account.address,
-            "nonce": nonce,
+            "nonce": 0,
+            "gas": 0,
+            "chainId": _get_chain_id(w3),
             "gasPrice": MIN_GAS_PRICE,  # 100 gwei — MONAD REQUIREMENT
         }
     )
+    call = {k: tx[k] for k in ("from", "to", "data", "gasPrice")}
 
-    gas_estimate = w3.eth.estimate_gas(tx)
+    # Nonce + gas estimate in a single JSON-RPC batch (one HTTP round trip)
+    with w3.batch_requests() as batch:
+        batch.add(w3.eth.get_transaction_count(account.address))
+        batch.add(w3.eth.estimate_gas(call))
+        nonce, gas_estimate = batch.execute()
+
+    tx["nonce"] = nonce
     tx["gas"] = gas_estimate
     signed_tx = w3.eth.account.sign_transaction(tx, private_key=cfg["private_key"])
     tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+    receipt = w3.eth.wait_for_transaction_receipt(
+        tx_hash, timeout=120, poll_latency=_receipt_poll_latency()
+    )
 
     if receipt["status"] != 1:
         raise RuntimeError(f"Transaction failed! Hash: {tx_hash.hex()}")
@@ -130,6 +196,28 @@ def read_sentiment(token: str) -> float:
     return score_int / 100.0
 
 
+def read_sentiments_batch(tokens: list[str]) -> dict[str, float]:
+    """
+    Read the stored sentiment scores for several tokens in one JSON-RPC batch
+    (a single HTTP round trip instead of one eth_call each).
+    Returns {token: score}.
+    """
+    if not _cfg()["contract_address"]:
+        raise ValueError("CONTRACT_ADDRESS not set in .env")
+    if not tokens:
+        return {}
+
+    w3 = _get_web3()
+    contract = _get_contract(w3)
+
+    with w3.batch_requests() as batch:
+        for token in tokens:
+            batch.add(contract.functions.getSentiment(token))
+        score_ints = batch.execute()
+
+    return {token: score_int / 100.0 for token, score_int in zip(tokens, score_ints)}
+
+
 def get_explorer_url(tx_hash: str) -> str:
     """Return the Monad testnet explorer URL for a transaction hash."""
     return f"https://testnet.monadexplorer.com/tx/0x{tx_hash.lstrip('0x')}"
@@ -8,14 +8,22 @@ Fetches real-time crypto news and social posts from two sources:
 Both return a list of plain text strings ready for sentiment analysis.
 """
 
+import io
 import re
-import json
+import time
 import email.utils
+import concurrent.futures
 import urllib.parse
-import urllib.request
-import urllib.error
 import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ijson  # optional: streams Reddit JSON instead of loading it whole
+except ImportError:
+    ijson = None
 
 # ── Reddit Config ──────────────────────────────────────────────────────
 # Maps token → subreddit name
@@ -28,28 +36,34 @@ REDDIT_SUBREDDITS: dict[str, str] = {
 # Reddit requires a User-Agent header or returns 429
 REDDIT_USER_AGENT = "SentimentFi/1.0 (hackathon project)"
 
+# The only post fields the fetchers read — all that's kept when streaming
+REDDIT_POST_FIELDS = frozenset(
+    {"title", "selftext", "permalink", "ups", "stickied", "created_utc", "subreddit"}
+)
+_REDDIT_POST_PREFIX = "data.children.item.data"
+
 # Maximum age for token live feeds (1 week)
 MAX_AGE_SECONDS = 7 * 24 * 3600
 # Maximum age for custom query search (30 days — niche topics have older content)
 MAX_QUERY_AGE_SECONDS = 30 * 24 * 3600
 
 
-def _is_fresh(unix_ts: float, max_age: int = MAX_AGE_SECONDS) -> bool:
+def _is_fresh(unix_ts: float, max_age: int = MAX_AGE_SECONDS, now: float | None = None) -> bool:
     """Return True if the Unix timestamp is within max_age seconds of now."""
     if not unix_ts:
         return False
     try:
-        return (datetime.now(timezone.utc).timestamp() - float(unix_ts)) <= max_age
+        return ((time.time() if now is None else now) - float(unix_ts)) <= max_age
     except Exception:
         return False
 
 
-def _time_ago(unix_ts: float) -> str:
+def _time_ago(unix_ts: float, now: float | None = None) -> str:
     """Convert a Unix timestamp to a human-readable 'X ago' string."""
     if not unix_ts:
         return ""
     try:
-        diff = int(datetime.now(timezone.utc).timestamp() - unix_ts)
+        diff = int((time.time() if now is None else now) - unix_ts)
         if diff < 60:        return f"{diff}s ago"
         if diff < 3600:      return f"{diff // 60}m ago"
         if diff < 86400:     return f"{diff // 3600}h ago"
@@ -58,15 +72,19 @@ def _time_ago(unix_ts: float) -> str:
         return ""
 
 
-def _parse_pub_date(pub: str) -> str:
-    """Parse an RSS pubDate string to a relative age like '2h ago'."""
+def _parse_rfc2822(pub: str) -> float:
+    """Parse an RSS pubDate string to a Unix timestamp (0.0 if missing/invalid)."""
     if not pub:
-        return ""
+        return 0.0
     try:
-        ts = email.utils.parsedate_to_datetime(pub).timestamp()
-        return _time_ago(ts)
+        return email.utils.parsedate_to_datetime(pub).timestamp()
     except Exception:
-        return pub[:16]
+        return 0.0
+
+
+def _pub_age(pub: str, pub_ts: float, now: float | None = None) -> str:
+    """Relative age like '2h ago' for a parsed pubDate; raw pubDate if unparseable."""
+    return _time_ago(pub_ts, now) if pub_ts else pub[:16]
 
 # ── News Config ──────────────────────────────────────────────────────────
 # Keywords to filter headlines by token
@@ -76,12 +94,158 @@ TOKEN_KEYWORDS: dict[str, list[str]] = {
     "ETH":   ["ethereum", "eth", "vitalik"],
 }
 
+# Keyword → subreddit, for picking a fallback subreddit from a free-text query.
+# One word-bounded alternation finds every keyword in a single scan; when a
+# query names several tokens, TOKEN_KEYWORDS order decides (monad > bitcoin > ethereum).
+_SUB_MAP: dict[str, str] = {
+    kw: REDDIT_SUBREDDITS[tok] for tok, kws in TOKEN_KEYWORDS.items() for kw in kws
+}
+_SUB_FALLBACK_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(_SUB_MAP, key=len, reverse=True))) + r")\b"
+)
+_SUB_PRIORITY: dict[str, int] = {REDDIT_SUBREDDITS[tok]: i for i, tok in enumerate(TOKEN_KEYWORDS)}
+
+
+def _fallback_subreddit(query: str) -> str | None:
+    """Subreddit of the highest-priority token named in query, or None."""
+    subs = {_SUB_MAP[m.group(1)] for m in _SUB_FALLBACK_RE.finditer(query.lower())}
+    return min(subs, key=_SUB_PRIORITY.__getitem__, default=None)
+
 NEWS_FEEDS = [
     {"name": "CoinDesk",  "url": "https://www.coindesk.com/arc/outboundfeeds/rss/"},
     {"name": "Decrypt",   "url": "https://decrypt.co/feed"},
     {"name": "CoinGape",  "url": "https://coingape.com/feed/"},
 ]
 
+NEWS_USER_AGENT = "Mozilla/5.0 (SentimentFi/1.0)"
+
+# Compiled once at import — used inside the per-item loops below
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE     = re.compile(r"[a-zA-Z0-9]{3,}")
+
+
+# ── Pooled HTTP ──────────────────────────────────────────────────────
+# One keep-alive session for every request, so repeat calls to Reddit and
+# the RSS hosts reuse sockets instead of paying a TCP + TLS handshake each time.
+# Failed connects are retried twice with a short backoff; reads are not
+# retried, so a host that stalls mid-response costs one read timeout, not three.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.3),
+))
+
+# Seconds to wait for a TCP connect; the per-call timeout bounds each read.
+# A host that won't accept a connection fails fast instead of holding the spinner.
+CONNECT_TIMEOUT = 3
+
+# Workers for fanning requests out over _SESSION
+_HTTP_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="datafetcher")
+
+
+# Feed URL → (etag, last_modified, raw_xml, stored_at) for conditional GETs
+_feed_cache: dict[str, tuple[str, str, bytes, float]] = {}
+# Reuse a cached feed without any request while it is younger than this
+FEED_CACHE_TTL_SECONDS = 60
+
+
+def _http_get(url: str, user_agent: str, timeout: int, headers: dict | None = None) -> requests.Response:
+    """GET through the shared session, raising on HTTP error statuses."""
+    resp = _SESSION.get(url, headers={"User-Agent": user_agent, **(headers or {})},
+                        timeout=(CONNECT_TIMEOUT, timeout))
+    resp.raise_for_status()
+    return resp
+
+
+def _fetch_feed(feed: dict, timeout: int) -> tuple[dict, bytes]:
+    """
+    Download one RSS feed. Returns (feed, raw_xml).
+
+    Feeds change a few times an hour, so bodies are cached per URL: within
+    FEED_CACHE_TTL_SECONDS the cached body is returned as-is, after that the
+    feed is revalidated with If-None-Match / If-Modified-Since and a
+    304 Not Modified reuses the cached body.
+    """
+    url = feed["url"]
+    cached = _feed_cache.get(url)
+    now = time.time()
+    if cached and now - cached[3] < FEED_CACHE_TTL_SECONDS:
+        return feed, cached[2]
+
+    headers = {}
+    if cached:
+        etag, last_modified, _, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    resp = _http_get(url, NEWS_USER_AGENT, timeout, headers)
+    if resp.status_code == 304 and cached:
+        _feed_cache[url] = (cached[0], cached[1], cached[2], now)
+        return feed, cached[2]
+
+    raw_xml = resp.content
+    _feed_cache[url] = (
+        resp.headers.get("ETag", ""),
+        resp.headers.get("Last-Modified", ""),
+        raw_xml,
+        now,
+    )
+    return feed, raw_xml
+
+
+def _iter_reddit_posts(stream):
+    """
+    Stream post dicts (children[].data) out of a Reddit listing with ijson,
+    keeping only REDDIT_POST_FIELDS. Everything else in the payload — media,
+    awards, flair, previews — is lexed past without building Python objects.
+    """
+    post = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if prefix == _REDDIT_POST_PREFIX:
+            if event == "start_map":
+                post = {}
+            elif event == "end_map":
+                yield post
+                post = None
+        elif post is not None and event in ("string", "number", "boolean", "null"):
+            field = prefix[len(_REDDIT_POST_PREFIX) + 1:]
+            if field in REDDIT_POST_FIELDS:
+                post[field] = value
+
+
+def _fetch_reddit_posts(url: str, timeout: int) -> list[dict]:
+    """GET a Reddit listing and return its posts (children[].data)."""
+    with _SESSION.get(url, headers={"User-Agent": REDDIT_USER_AGENT},
+                      timeout=(CONNECT_TIMEOUT, timeout), stream=True) as resp:
+        resp.raise_for_status()
+        if ijson is None:
+            data = resp.json()
+            return [child.get("data", {}) for child in data.get("data", {}).get("children", [])]
+        resp.raw.decode_content = True  # let urllib3 undo gzip before ijson reads
+        return list(_iter_reddit_posts(resp.raw))
+
+
+def _gather_feeds(timeout: int, reddit_url: str | None = None) -> list:
+    """
+    Fetch every feed in NEWS_FEEDS (plus an optional Reddit URL, appended last)
+    concurrently, so wall time is the slowest request rather than the sum.
+    Failed requests come back as exception objects in their slot.
+    """
+    futures = [_HTTP_POOL.submit(_fetch_feed, feed, timeout) for feed in NEWS_FEEDS]
+    if reddit_url:
+        futures.append(_HTTP_POOL.submit(_fetch_reddit_posts, reddit_url, timeout))
+
+    results = []
+    for f in futures:
+        try:
+            results.append(f.result())
+        except Exception as e:
+            results.append(e)
+    return results
+
 
 # ── Reddit Fetcher ─────────────────────────────────────────────────────
 
@@ -103,18 +267,13 @@ def fetch_reddit(token: str, limit: int = 10, timeout: int = 8) -> list[dict]:
         return []
 
     url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit={limit}"
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": REDDIT_USER_AGENT},
-    )
 
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read().decode())
+        listing = _fetch_reddit_posts(url, timeout)
+        now_ts = time.time()
 
         posts = []
-        for child in data.get("data", {}).get("children", []):
-            post = child.get("data", {})
+        for post in listing:
             title = post.get("title", "").strip()
             selftext = post.get("selftext", "").strip()
 
@@ -123,7 +282,7 @@ def fetch_reddit(token: str, limit: int = 10, timeout: int = 8) -> list[dict]:
                 selftext = ""
 
             # Skip posts older than 1 week
-            if not _is_fresh(post.get("created_utc", 0)):
+            if not _is_fresh(post.get("created_utc", 0), now=now_ts):
                 continue
 
             # Use title + first 200 chars of body if available
@@ -139,7 +298,7 @@ def fetch_reddit(token: str, limit: int = 10, timeout: int = 8) -> list[dict]:
                     "upvotes":   post.get("ups", 0),
                     "subreddit": subreddit,
                     "source":    "Reddit",
-                    "age":       _time_ago(post.get("created_utc", 0)),
+                    "age":       _time_ago(post.get("created_utc", 0), now_ts),
                 })
 
         return posts
@@ -151,6 +310,39 @@ def fetch_reddit(token: str, limit: int = 10, timeout: int = 8) -> list[dict]:
 
 # ── Crypto News RSS Fetcher ───────────────────────────────────────────
 
+def _iter_rss_items(raw_xml: bytes):
+    """
+    Stream (title, link, description, pubDate) tuples out of an RSS document.
+
+    Uses iterparse so parsing stops as soon as the caller stops iterating
+    (e.g. once its limit is reached), and clears each <item> after reading
+    it so the full DOM is never held in memory.
+    """
+    for _, elem in ET.iterparse(io.BytesIO(raw_xml), events=("end",)):
+        if elem.tag != "item":
+            continue
+        yield (
+            (elem.findtext("title") or "").strip(),
+            (elem.findtext("link")  or "").strip(),
+            (elem.findtext("description") or "").strip(),
+            (elem.findtext("pubDate") or "").strip(),
+        )
+        elem.clear()
+
+
+def _keyword_res(keywords: list[str]) -> tuple[re.Pattern, re.Pattern]:
+    """
+    Compile keywords into case-insensitive (bytes, str) alternations.
+    The bytes pattern screens a raw feed before any XML parsing; the str
+    pattern filters individual items in one pass.
+    """
+    alternation = "|".join(map(re.escape, keywords))
+    return (
+        re.compile(alternation.encode(), re.IGNORECASE),
+        re.compile(alternation, re.IGNORECASE),
+    )
+
+
 def fetch_news(token: str, limit: int = 10, timeout: int = 8) -> list[dict]:
     """
     Fetch crypto news from CoinDesk, Decrypt, and CoinGape RSS feeds,
@@ -166,53 +358,41 @@ def fetch_news(token: str, limit: int = 10, timeout: int = 8) -> list[dict]:
         Returns empty list on total failure.
     """
     keywords = TOKEN_KEYWORDS.get(token, [token.lower()])
+    kw_bytes_re, kw_re = _keyword_res(keywords)
     all_posts: list[dict] = []
 
-    for feed in NEWS_FEEDS:
+    results = _gather_feeds(timeout)
+    now_ts = time.time()
+
+    for feed, result in zip(NEWS_FEEDS, results):
         if len(all_posts) >= limit:
             break
         try:
-            req = urllib.request.Request(
-                feed["url"],
-                headers={"User-Agent": "Mozilla/5.0 (SentimentFi/1.0)"},
-            )
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                raw_xml = resp.read()
-
-            root = ET.fromstring(raw_xml)
-            channel = root.find("channel")
-            items = (channel if channel is not None else root).findall("item")
-
-            for item in items:
+            if isinstance(result, BaseException):
+                raise result
+            _, raw_xml = result
+
+            # No keyword anywhere in the feed — nothing to parse
+            if not kw_bytes_re.search(raw_xml):
+                continue
+
+            for title, link, desc, pub in _iter_rss_items(raw_xml):
                 if len(all_posts) >= limit:
                     break
 
-                title = (item.findtext("title") or "").strip()
-                link  = (item.findtext("link")  or "").strip()
-                desc  = (item.findtext("description") or "").strip()
-                pub   = (item.findtext("pubDate") or "").strip()
-
                 # Filter by token keywords (case-insensitive)
-                combined_raw = (title + " " + desc).lower()
-                if not any(kw in combined_raw for kw in keywords):
+                if not (kw_re.search(title) or kw_re.search(desc)):
                     continue
 
                 # Strip HTML tags from description
-                desc_clean = re.sub(r"<[^>]+>", "", desc)[:200].strip()
+                desc_clean = _HTML_TAG_RE.sub("", desc)[:200].strip()
                 text = title
                 if desc_clean and desc_clean.lower() != title.lower():
                     text += " — " + desc_clean
 
-                # Parse pubDate to relative age
-                age = _parse_pub_date(pub)
-
-                # Skip articles older than 1 week
-                ts = 0
-                try:
-                    ts = email.utils.parsedate_to_datetime(pub).timestamp() if pub else 0
-                except Exception:
-                    pass
-                if ts and not _is_fresh(ts):
+                # Parse pubDate once; skip articles older than 1 week
+                pub_ts = _parse_rfc2822(pub)
+                if pub_ts and not _is_fresh(pub_ts, now=now_ts):
                     continue
 
                 all_posts.append({
@@ -220,7 +400,7 @@ def fetch_news(token: str, limit: int = 10, timeout: int = 8) -> list[dict]:
                     "text":    text,
                     "url":     link,
                     "source":  feed["name"],
-                    "age":     age,
+                    "age":     _pub_age(pub, pub_ts, now_ts),
                     "upvotes": None,
                 })
 
@@ -253,16 +433,18 @@ def fetch_by_query(query: str, reddit_limit: int = 8, news_limit: int = 8, timeo
         return {"reddit": [], "cryptopanic": [], "combined_texts": [],
                 "reddit_ok": False, "cryptopanic_ok": False, "total": 0}
 
-    # ── Reddit search ────────────────────────────────────────────
+    # ── Reddit search + news feeds, fetched concurrently ─────────────
     encoded = urllib.parse.quote_plus(query)
     reddit_url = f"https://www.reddit.com/search.json?q={encoded}&limit={reddit_limit}&sort=relevance&type=link"
-    req = urllib.request.Request(reddit_url, headers={"User-Agent": REDDIT_USER_AGENT})
+    *feed_results, reddit_result = _gather_feeds(timeout, reddit_url)
+    now_ts = time.time()
+
+    # ── Reddit search ────────────────────────────────────────────
     reddit_posts: list[dict] = []
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read().decode())
-        for child in data.get("data", {}).get("children", []):
-            post = child.get("data", {})
+        if isinstance(reddit_result, BaseException):
+            raise reddit_result
+        for post in reddit_result:
             title    = post.get("title", "").strip()
             selftext = post.get("selftext", "").strip()
             if post.get("stickied") or selftext in ("[removed]", "[deleted]"):
@@ -272,7 +454,7 @@ def fetch_by_query(query: str, reddit_limit: int = 8, news_limit: int = 8, timeo
                 combined += " — " + selftext[:200]
             if combined:
                 # Skip posts older than 30 days for query-based search
-                if not _is_fresh(post.get("created_utc", 0), MAX_QUERY_AGE_SECONDS):
+                if not _is_fresh(post.get("created_utc", 0), MAX_QUERY_AGE_SECONDS, now_ts):
                     continue
                 reddit_posts.append({
                     "title":     title,
@@ -281,56 +463,44 @@ def fetch_by_query(query: str, reddit_limit: int = 8, news_limit: int = 8, timeo
                     "upvotes":   post.get("ups", 0),
                     "subreddit": post.get("subreddit", "r/search"),
                     "source":    "Reddit",
-                    "age":       _time_ago(post.get("created_utc", 0)),
+                    "age":       _time_ago(post.get("created_utc", 0), now_ts),
                 })
     except Exception as e:
         print(f"[DataFetcher] Reddit query search failed: {e}")
 
     # ── News RSS filtered by query keywords ───────────────────────────
     # Extract meaningful words (3+ chars) from the query as filter keywords
-    keywords = [w.lower() for w in re.findall(r"[a-zA-Z0-9]{3,}", query)]
+    keywords = [w.lower() for w in _WORD_RE.findall(query)]
+    kw_bytes_re, kw_re = _keyword_res(keywords) if keywords else (None, None)
     news_posts: list[dict] = []
-    for feed in NEWS_FEEDS:
+    for feed, result in zip(NEWS_FEEDS, feed_results):
         if len(news_posts) >= news_limit:
             break
         try:
-            req2 = urllib.request.Request(
-                feed["url"],
-                headers={"User-Agent": "Mozilla/5.0 (SentimentFi/1.0)"},
-            )
-            with urllib.request.urlopen(req2, timeout=timeout) as resp:
-                raw_xml = resp.read()
-            root    = ET.fromstring(raw_xml)
-            channel = root.find("channel")
-            items   = (channel if channel is not None else root).findall("item")
-            for item in items:
+            if isinstance(result, BaseException):
+                raise result
+            _, raw_xml = result
+            if kw_bytes_re and not kw_bytes_re.search(raw_xml):
+                continue
+            for title, link, desc, pub in _iter_rss_items(raw_xml):
                 if len(news_posts) >= news_limit:
                     break
-                title = (item.findtext("title") or "").strip()
-                link  = (item.findtext("link")  or "").strip()
-                desc  = (item.findtext("description") or "").strip()
-                pub   = (item.findtext("pubDate") or "").strip()
-                combined_raw = (title + " " + desc).lower()
-                if keywords and not any(kw in combined_raw for kw in keywords):
+                if kw_re and not (kw_re.search(title) or kw_re.search(desc)):
                     continue
-                desc_clean = re.sub(r"<[^>]+>", "", desc)[:200].strip()
+                desc_clean = _HTML_TAG_RE.sub("", desc)[:200].strip()
                 text = title
                 if desc_clean and desc_clean.lower() != title.lower():
                     text += " — " + desc_clean
                 # Skip articles older than 30 days for query search
-                _ts = 0
-                try:
-                    _ts = email.utils.parsedate_to_datetime(pub).timestamp() if pub else 0
-                except Exception:
-                    pass
-                if _ts and not _is_fresh(_ts, MAX_QUERY_AGE_SECONDS):
+                pub_ts = _parse_rfc2822(pub)
+                if pub_ts and not _is_fresh(pub_ts, MAX_QUERY_AGE_SECONDS, now_ts):
                     continue
                 news_posts.append({
                     "title":   title,
                     "text":    text,
                     "url":     link,
                     "source":  feed["name"],
-                    "age":     _parse_pub_date(pub),
+                    "age":     _pub_age(pub, pub_ts, now_ts),
                     "upvotes": None,
                 })
         except Exception as e:
@@ -339,28 +509,17 @@ def fetch_by_query(query: str, reddit_limit: int = 8, news_limit: int = 8, timeo
     # ── Subreddit fallback if Reddit search returned fewer than 4 posts ──
     # Detect token context from query and pull directly from its subreddit
     if len(reddit_posts) < 4:
-        q_lower = query.lower()
-        fallback_sub = None
-        if any(w in q_lower for w in ["monad"]):
-            fallback_sub = "monad"
-        elif any(w in q_lower for w in ["bitcoin", "btc"]):
-            fallback_sub = "Bitcoin"
-        elif any(w in q_lower for w in ["ethereum", "eth", "vitalik"]):
-            fallback_sub = "ethereum"
+        fallback_sub = _fallback_subreddit(query)
         if fallback_sub:
             try:
                 fb_url = f"https://www.reddit.com/r/{fallback_sub}/hot.json?limit={reddit_limit}"
-                fb_req = urllib.request.Request(fb_url, headers={"User-Agent": REDDIT_USER_AGENT})
-                with urllib.request.urlopen(fb_req, timeout=timeout) as resp:
-                    fb_data = json.loads(resp.read().decode())
-                for child in fb_data.get("data", {}).get("children", []):
-                    post = child.get("data", {})
+                for post in _fetch_reddit_posts(fb_url, timeout):
                     title    = post.get("title", "").strip()
                     selftext = post.get("selftext", "").strip()
                     if post.get("stickied") or selftext in ("[removed]", "[deleted]"):
                         selftext = ""
                     combined = title + (" — " + selftext[:200] if selftext else "")
-                    if combined and _is_fresh(post.get("created_utc", 0), MAX_QUERY_AGE_SECONDS):
+                    if combined and _is_fresh(post.get("created_utc", 0), MAX_QUERY_AGE_SECONDS, now_ts):
                         reddit_posts.append({
                             "title":     title,
                             "text":      combined,
@@ -368,7 +527,7 @@ def fetch_by_query(query: str, reddit_limit: int = 8, news_limit: int = 8, timeo
                             "upvotes":   post.get("ups", 0),
                             "subreddit": fallback_sub,
                             "source":    "Reddit",
-                            "age":       _time_ago(post.get("created_utc", 0)),
+                            "age":       _time_ago(post.get("created_utc", 0), now_ts),
                         })
             except Exception as e:
                 print(f"[DataFetcher] Subreddit fallback failed for {fallback_sub}: {e}")
@@ -409,8 +568,12 @@ def fetch_all(token: str, reddit_limit: int = 8, news_limit: int = 10) -> dict:
             cryptopanic_ok: bool — whether news fetch succeeded
             total:          total signal count
     """
-    reddit_posts = fetch_reddit(token, limit=reddit_limit)
-    news_posts   = fetch_news(token, limit=news_limit)
+    # Both fetchers block on network I/O — run them side by side
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        f_reddit = ex.submit(fetch_reddit, token, limit=reddit_limit)
+        f_news   = ex.submit(fetch_news, token, limit=news_limit)
+        reddit_posts = f_reddit.result()
+        news_posts   = f_news.result()
 
     all_texts = (
         [p["text"] for p in reddit_posts] +
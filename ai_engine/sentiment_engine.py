@@ -3,25 +3,175 @@ SentimentFi — AI Sentiment Engine
 ==================================
 Uses HuggingFace transformers pipeline to analyze crypto-related text
 and produce a normalized sentiment score between -1.0 and +1.0.
+
+Clear-cut texts are labelled by NLTK's rule-based VADER first; only the
+ambiguous remainder is run through the transformer.
 """
 
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
 _sentiment_pipeline = None
+_pipeline_lock = threading.Lock()
+_vader = None
+
+# Transformer results by text, least recently used first. Back-to-back
+# refreshes and news/query fetches share many posts; repeats skip inference.
+_result_cache: OrderedDict[str, dict] = OrderedDict()
+_result_cache_lock = threading.Lock()
+RESULT_CACHE_SIZE = 4096
 
 MODEL_NAME = "distilbert-base-uncased-finetuned-sst-2-english"
 
+# Where the int8 ONNX export of MODEL_NAME is cached (see _load_onnx_pipeline)
+ONNX_MODEL_DIR = Path(__file__).resolve().parent.parent / ".model_cache" / "onnx" / MODEL_NAME
+ONNX_MODEL_FILE = "model_quantized.onnx"
+
+# Texts per forward pass. Each batch is padded to its own longest text,
+# not to max_length.
+BATCH_SIZE = 16
+
+# Texts whose VADER compound score is beyond ±this are labelled by VADER
+# alone; only the ambiguous rest are sent to the transformer
+VADER_THRESHOLD = 0.4
+
+# Texts are cut to this many characters before scoring. The model only sees
+# the first 512 tokens anyway; this spares tokenizing long Reddit bodies.
+MAX_TEXT_CHARS = 1500
+
+
+def _load_onnx_pipeline():
+    """
+    Build the pipeline on an int8-quantized ONNX Runtime model via optimum,
+    or return None if optimum isn't installed (or export/quantization fails).
+    The model is exported and dynamically quantized once, into ONNX_MODEL_DIR,
+    so later cold starts load the quantized graph directly.
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer  # noqa: PLC0415
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig  # noqa: PLC0415
+    except ImportError:
+        return None
+
+    from transformers import AutoTokenizer, pipeline  # noqa: PLC0415
+
+    try:
+        if not (ONNX_MODEL_DIR / ONNX_MODEL_FILE).exists():
+            exported = ORTModelForSequenceClassification.from_pretrained(MODEL_NAME, export=True)
+            exported.save_pretrained(ONNX_MODEL_DIR)
+            AutoTokenizer.from_pretrained(MODEL_NAME).save_pretrained(ONNX_MODEL_DIR)
+            # Dynamic int8 (no calibration data needed) — uses VNNI
+            # dot-product instructions where the CPU has them
+            ORTQuantizer.from_pretrained(exported).quantize(
+                save_dir=ONNX_MODEL_DIR,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+            )
+
+        model = ORTModelForSequenceClassification.from_pretrained(
+            ONNX_MODEL_DIR, file_name=ONNX_MODEL_FILE, provider="CPUExecutionProvider"
+        )
+        tokenizer = AutoTokenizer.from_pretrained(ONNX_MODEL_DIR)
+        return pipeline(  # type: ignore
+            "sentiment-analysis",
+            model=model,
+            tokenizer=tokenizer,
+            batch_size=BATCH_SIZE,
+        )
+    except Exception as e:
+        print(f"[SentimentEngine] ONNX Runtime unavailable, using PyTorch: {e}")
+        return None
+
+
+def _build_pipeline():
+    """
+    Build the HuggingFace sentiment-analysis pipeline.
+    GPU + fp16 when CUDA is available; on CPU, int8 ONNX Runtime if optimum
+    is installed, otherwise int8-quantized PyTorch.
+    """
+    import torch  # noqa: PLC0415
+    from transformers import pipeline  # noqa: PLC0415
+
+    use_cuda = torch.cuda.is_available()
+    if not use_cuda:
+        pipe = _load_onnx_pipeline()
+        if pipe is not None:
+            return pipe
+
+    pipe = pipeline(  # type: ignore
+        "sentiment-analysis",
+        model=MODEL_NAME,
+        device=0 if use_cuda else -1,
+        torch_dtype=torch.float16 if use_cuda else torch.float32,
+        batch_size=BATCH_SIZE,
+    )
+    if not use_cuda:
+        # int8 dynamic quantization of the Linear layers (the bulk of the
+        # FLOPs) — roughly 2x faster on CPU, negligible accuracy loss on SST-2
+        pipe.model = torch.quantization.quantize_dynamic(
+            pipe.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return pipe
+
 
 def _get_pipeline():
-    """Lazy-load the HuggingFace sentiment-analysis pipeline."""
+    """
+    Lazy-load the process-wide sentiment pipeline.
+
+    Module state survives Streamlit reruns, so the model is materialized
+    once per process; the lock keeps concurrent sessions from each loading
+    their own copy on a cold start.
+    """
     global _sentiment_pipeline
     if _sentiment_pipeline is None:
-        from transformers import pipeline  # noqa: PLC0415
-        _sentiment_pipeline = pipeline(  # type: ignore
-            "sentiment-analysis",
-            model=MODEL_NAME,
-        )
+        with _pipeline_lock:
+            if _sentiment_pipeline is None:
+                _sentiment_pipeline = _build_pipeline()
     return _sentiment_pipeline
 
 
+def _get_vader():
+    """
+    Lazy-load NLTK's VADER analyzer (downloading its lexicon on first use).
+    Returns None if nltk is not installed or the lexicon can't be fetched,
+    in which case every text goes through the transformer.
+    """
+    global _vader
+    if _vader is None:
+        try:
+            from nltk.sentiment.vader import SentimentIntensityAnalyzer  # noqa: PLC0415
+            try:
+                _vader = SentimentIntensityAnalyzer()
+            except LookupError:
+                import nltk  # noqa: PLC0415
+                nltk.download("vader_lexicon", quiet=True)
+                _vader = SentimentIntensityAnalyzer()
+        except Exception as e:
+            print(f"[SentimentEngine] VADER unavailable, using transformer only: {e}")
+            _vader = False
+    return _vader or None
+
+
+def _cached_result(text: str) -> dict | None:
+    """Return the cached transformer result for text, if any."""
+    with _result_cache_lock:
+        result = _result_cache.get(text)
+        if result is not None:
+            _result_cache.move_to_end(text)
+    return result
+
+
+def _cache_result(text: str, result: dict) -> None:
+    """Store a transformer result, evicting the least recently used entries."""
+    with _result_cache_lock:
+        _result_cache[text] = result
+        _result_cache.move_to_end(text)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
 def analyze_sentiment(texts: list[str]) -> float:
     """
     Analyze a list of text strings and return an aggregated sentiment score.
@@ -45,6 +195,7 @@ def analyze_sentiment_detailed(texts: list[str]) -> dict:
         model        : model name used
         breakdown    : list of {text, label, confidence, contribution}
     """
+    texts = [t[:MAX_TEXT_CHARS] for t in texts if t]
     if not texts:
         return {
             "score": 0.0,
@@ -55,10 +206,43 @@ def analyze_sentiment_detailed(texts: list[str]) -> dict:
             "breakdown": [],
         }
 
-    pipe = _get_pipeline()
+    # Fast path: rule-based VADER settles clear-cut short snippets in microseconds
+    results: list[dict | None] = [None] * len(texts)
+    vader = _get_vader()
+    if vader is not None:
+        for i, text in enumerate(texts):
+            compound = vader.polarity_scores(text)["compound"]
+            if abs(compound) > VADER_THRESHOLD:
+                results[i] = {
+                    "label": "POSITIVE" if compound > 0 else "NEGATIVE",
+                    "score": abs(compound),
+                }
+
+    # Reuse transformer results for texts seen in earlier calls
+    pending = []
+    for i, r in enumerate(results):
+        if r is None:
+            results[i] = _cached_result(texts[i])
+            if results[i] is None:
+                pending.append(i)
 
+    # Loaded outside the try below: a missing model stack is an error for
+    # the caller, not a neutral score
+    pipe = _get_pipeline() if pending else None
     try:
-        results = pipe(texts, truncation=True, max_length=512)
+        if pending:
+            # Forward each distinct text once (cross-posts, echoed headlines),
+            # then fan the results back out to every position
+            unique_texts = list(dict.fromkeys(texts[i] for i in pending))
+            # Length-sorted, so each batch holds similar-length texts and
+            # pads little (short Reddit titles vs. long article snippets)
+            unique_texts.sort(key=len)
+            pipe_results = pipe(unique_texts, truncation=True, max_length=512)
+            result_by_text = dict(zip(unique_texts, pipe_results))
+            for text, result in result_by_text.items():
+                _cache_result(text, result)
+            for i in pending:
+                results[i] = result_by_text[texts[i]]
     except Exception as e:
         print(f"[SentimentEngine] Error during analysis: {e}")
         return {
@@ -70,35 +254,28 @@ def analyze_sentiment_detailed(texts: list[str]) -> dict:
             "breakdown": [],
         }
 
-    total_score = 0.0
-    total_confidence = 0.0
-    bullish = 0
-    bearish = 0
-    breakdown = []
-
-    for text, result in zip(texts, results):
-        label = result["label"]
-        confidence = result["score"]
-        contribution = confidence if label == "POSITIVE" else -confidence
-
-        total_score += contribution
-        total_confidence += confidence
+    # Aggregate with vector math rather than a per-item Python loop
+    n = len(results)
+    positive = np.fromiter((r["label"] == "POSITIVE" for r in results), dtype=bool, count=n)
+    confidences = np.fromiter((r["score"] for r in results), dtype=np.float64, count=n)
+    contributions = np.where(positive, confidences, -confidences)
 
-        if label == "POSITIVE":
-            bullish += 1
-        else:
-            bearish += 1
+    bullish = int(positive.sum())
+    bearish = n - bullish
+    avg_score = float(np.clip(contributions.mean(), -1.0, 1.0))
+    avg_confidence = float(confidences.mean())
 
-        breakdown.append({
+    breakdown = [
+        {
             "text": text[:80] + "..." if len(text) > 80 else text,
-            "label": label,
+            "label": result["label"],
             "confidence": round(confidence, 4),
             "contribution": round(contribution, 4),
-        })
-
-    n = len(results)
-    avg_score = max(-1.0, min(1.0, total_score / n))
-    avg_confidence = total_confidence / n
+        }
+        for text, result, confidence, contribution in zip(
+            texts, results, confidences.tolist(), contributions.tolist()
+        )
+    ]
 
     return {
         "score": round(avg_score, 6),
@@ -14,24 +14,24 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import streamlit as st
 import pandas as pd
+import altair as alt
+from collections import ChainMap, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Bridge Streamlit Cloud secrets → os.environ so ai_engine can read them via os.getenv()
-for _key in ("MONAD_RPC_URL", "PRIVATE_KEY", "CONTRACT_ADDRESS"):
-    if _key not in os.environ:
-        try:
-            os.environ[_key] = st.secrets[_key]
-        except (KeyError, FileNotFoundError):
-            pass
+# (secrets.toml is parsed once here rather than once per key)
+try:
+    _secrets = st.secrets.to_dict()
+except FileNotFoundError:
+    _secrets = {}
+os.environ.update({
+    _key: str(_secrets[_key])
+    for _key in ("MONAD_RPC_URL", "PRIVATE_KEY", "CONTRACT_ADDRESS", "RECEIPT_POLL_LATENCY")
+    if _key in _secrets and _key not in os.environ
+})
 
-from ai_engine.sentiment_engine import analyze_sentiment_detailed, MODEL_NAME
 from ai_engine.data_fetcher import fetch_all, fetch_by_query
-from ai_engine.blockchain import (
-    push_onchain,
-    read_sentiment,
-    get_explorer_url,
-    check_connection,
-)
 
 # ── Page Config ────────────────────────────────────────────────────────
 
@@ -43,222 +43,39 @@ st.set_page_config(
 )
 
 # ── Monad UI Kit Theme (Dark Purple) ──────────────────────────────────
-# Colors extracted from: https://github.com/airfoil-frontend/monad-ui-kit
-# purple-400: hsla(249, 92%, 76%, 1)  →  #9B8AFA
-# purple-500: hsla(249, 92%, 70%, 1)  →  #836EF9
-# purple-600: hsla(249, 100%, 66%, 1) →  #7C52FF  (main brand)
-# purple-900: hsla(263, 100%, 16%, 1) →  #2A0052
-# background: hsl(240, 10%, 4%)       →  #0A0A10
-# card:       hsl(0, 0%, 3.9%)        →  #0A0A0A
-# secondary:  hsl(240, 4%, 16%)       →  #272729
-# muted-fg:   hsl(0, 0%, 63.9%)      →  #A3A3A3
+# Base colours live in .streamlit/config.toml ([theme]); the remaining
+# custom selectors are in assets/monad.css, read from disk once per process.
+
+@st.cache_data(show_spinner=False)
+def _load_css() -> str:
+    """Return the custom Monad stylesheet."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "monad.css")
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
 
 st.markdown(
-    """
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-
-    /* ── Global ────────────────────────────────────────── */
-    .stApp {
-        background-color: #0A0A10 !important;
-        color: #FAFAFA !important;
-        font-family: 'Inter', sans-serif !important;
-    }
-
-    /* ── Top header bar ────────────────────────────────── */
-    header[data-testid="stHeader"] {
-        background-color: #0A0A10 !important;
-    }
-
-    /* ── Sidebar ───────────────────────────────────────── */
-    section[data-testid="stSidebar"] {
-        background-color: #111114 !important;
-    }
-
-    /* ── Metric cards ──────────────────────────────────── */
-    div[data-testid="stMetric"] {
-        background: linear-gradient(135deg, #1A1A2E 0%, #16162A 100%);
-        border: 1px solid #272729;
-        border-radius: 0.6rem;
-        padding: 1rem 1.25rem;
-    }
-    div[data-testid="stMetric"] label {
-        color: #A3A3A3 !important;
-        font-weight: 500 !important;
-    }
-    div[data-testid="stMetric"] div[data-testid="stMetricValue"] {
-        color: #FAFAFA !important;
-        font-weight: 700 !important;
-    }
-
-    /* ── Buttons ───────────────────────────────────────── */
-    .stButton > button {
-        background: linear-gradient(135deg, #7C52FF 0%, #836EF9 100%) !important;
-        color: #FAFAFA !important;
-        border: none !important;
-        border-radius: 0.5rem !important;
-        font-weight: 600 !important;
-        font-family: 'Inter', sans-serif !important;
-        padding: 0.6rem 1.5rem !important;
-        transition: all 0.2s ease !important;
-    }
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #9B8AFA 0%, #7C52FF 100%) !important;
-        box-shadow: 0 0 20px rgba(124, 82, 255, 0.3) !important;
-        transform: translateY(-1px) !important;
-    }
-    .stButton > button:active {
-        transform: translateY(0px) !important;
-    }
-
-    /* ── Select boxes / dropdowns ──────────────────────── */
-    .stSelectbox div[data-baseweb="select"] {
-        background-color: #1A1A2E !important;
-        border: 1px solid #272729 !important;
-        border-radius: 0.5rem !important;
-    }
-    .stSelectbox div[data-baseweb="select"] * {
-        color: #FAFAFA !important;
-    }
-
-    /* ── Text area ─────────────────────────────────────── */
-    .stTextArea textarea {
-        background-color: #1A1A2E !important;
-        color: #FAFAFA !important;
-        border: 1px solid #272729 !important;
-        border-radius: 0.5rem !important;
-        font-family: 'Inter', sans-serif !important;
-    }
-
-    /* ── Expander ──────────────────────────────────────── */
-    .streamlit-expanderHeader {
-        background-color: #1A1A2E !important;
-        color: #FAFAFA !important;
-        border-radius: 0.5rem !important;
-    }
-
-    /* ── Tabs ──────────────────────────────────────────── */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 4px;
-        border-bottom: 1px solid #272729 !important;
-    }
-    .stTabs [data-baseweb="tab"] {
-        color: #A3A3A3 !important;
-        font-family: 'Inter', sans-serif !important;
-    }
-    .stTabs [aria-selected="true"] {
-        color: #9B8AFA !important;
-        border-bottom: 2px solid #7C52FF !important;
-    }
-
-    /* ── Charts ────────────────────────────────────────── */
-    .stPlotlyChart, .stVegaLiteChart {
-        background-color: transparent !important;
-    }
-
-    /* ── Success / Error / Warning ─────────────────────── */
-    .stSuccess {
-        background-color: rgba(34, 197, 94, 0.1) !important;
-        border: 1px solid rgba(34, 197, 94, 0.3) !important;
-        color: #22C55E !important;
-    }
-    .stError {
-        background-color: rgba(239, 68, 68, 0.1) !important;
-        border: 1px solid rgba(239, 68, 68, 0.3) !important;
-    }
-
-    /* ── Divider ───────────────────────────────────────── */
-    hr {
-        border-color: #272729 !important;
-    }
-
-    /* ── Custom card class ─────────────────────────────── */
-    .monad-card {
-        background: linear-gradient(135deg, #1A1A2E 0%, #16162A 100%);
-        border: 1px solid #272729;
-        border-radius: 0.6rem;
-        padding: 1.5rem;
-        margin-bottom: 1rem;
-    }
-    .monad-card-glow {
-        background: linear-gradient(135deg, #1A1A2E 0%, #1E1640 100%);
-        border: 1px solid rgba(124, 82, 255, 0.3);
-        border-radius: 0.6rem;
-        padding: 1.5rem;
-        margin-bottom: 1rem;
-        box-shadow: 0 0 15px rgba(124, 82, 255, 0.1);
-    }
-
-    /* ── Hero header ───────────────────────────────────── */
-    .hero-title {
-        font-size: 2.5rem;
-        font-weight: 800;
-        background: linear-gradient(135deg, #9B8AFA 0%, #7C52FF 50%, #FAFAFA 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        margin-bottom: 0.5rem;
-        line-height: 1.2;
-    }
-    .hero-subtitle {
-        color: #A3A3A3;
-        font-size: 1.1rem;
-        font-weight: 400;
-        margin-bottom: 2rem;
-    }
-
-    /* ── Score display ─────────────────────────────────── */
-    .score-positive { color: #22C55E; font-size: 2rem; font-weight: 700; }
-    .score-negative { color: #EF4444; font-size: 2rem; font-weight: 700; }
-    .score-neutral  { color: #A3A3A3; font-size: 2rem; font-weight: 700; }
-
-    /* ── Badge ─────────────────────────────────────────── */
-    .monad-badge {
-        display: inline-block;
-        background: rgba(124, 82, 255, 0.15);
-        color: #9B8AFA;
-        padding: 0.25rem 0.75rem;
-        border-radius: 9999px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        letter-spacing: 0.05em;
-        text-transform: uppercase;
-    }
-
-    /* ── Link styling ──────────────────────────────────── */
-    a {
-        color: #9B8AFA !important;
-        text-decoration: none !important;
-    }
-    a:hover {
-        color: #7C52FF !important;
-        text-decoration: underline !important;
-    }
-
-    /* ── Scrollbar ─────────────────────────────────────── */
-    ::-webkit-scrollbar {
-        width: 6px;
-    }
-    ::-webkit-scrollbar-track {
-        background: #0A0A10;
-    }
-    ::-webkit-scrollbar-thumb {
-        background: #272729;
-        border-radius: 3px;
-    }
-    ::-webkit-scrollbar-thumb:hover {
-        background: #7C52FF;
-    }
-    </style>
-    """,
+    # <style> must come first: it keeps the blank lines in the CSS inside one
+    # HTML block. Fonts load via preconnect + <link> instead of a blocking @import.
+    f"<style>{_load_css()}</style>"
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap">',
     unsafe_allow_html=True,
 )
 
 
 # ── Session State Init ────────────────────────────────────────────────
 
+# Max sentiment history points kept per session
+MAX_HISTORY = 500
+
+# Tokens offered in the selector (and read together by "Read All Tokens")
+TOKENS = ["MONAD", "BTC", "ETH"]
+
 if "sentiment_history" not in st.session_state:
-    st.session_state.sentiment_history = []
+    # Bounded — oldest points drop off once MAX_HISTORY is reached
+    st.session_state.sentiment_history = deque(maxlen=MAX_HISTORY)
 
 if "last_score" not in st.session_state:
     st.session_state.last_score = None
@@ -266,6 +83,14 @@ if "last_score" not in st.session_state:
 if "last_tx_hash" not in st.session_state:
     st.session_state.last_tx_hash = None
 
+if "pending_tx" not in st.session_state:
+    # Future of an in-flight push_onchain call (see _poll_pending_tx)
+    st.session_state.pending_tx = None
+
+if "tx_notice" not in st.session_state:
+    # Outcome of the last push, shown once: ("confirmed", tx_hash) or ("failed", error)
+    st.session_state.tx_notice = None
+
 if "last_detail" not in st.session_state:
     st.session_state.last_detail = None
 
@@ -301,6 +126,147 @@ def get_score_emoji(score: float) -> str:
     return "🔴"
 
 
+# Post card markup, filled per post with str.format_map
+_REDDIT_TPL = (
+    '<div class="monad-card" style="padding:0.75rem;margin-bottom:0.4rem;">'
+    "<strong>{title}</strong><br>"
+    "<span style='color:#A3A3A3;font-size:0.75rem;'>r/{subreddit} &nbsp;•&nbsp; {age} &nbsp;•&nbsp; {upvotes}</span>"
+    "</div>"
+)
+_NEWS_TPL = (
+    '<div class="monad-card" style="padding:0.75rem;margin-bottom:0.4rem;">'
+    "<strong>{title}</strong><br>"
+    "<span style='color:#A3A3A3;font-size:0.75rem;'>{source} &nbsp;•&nbsp; {age}</span>"
+    "</div>"
+)
+_REDDIT_PREVIEW_TPL = (
+    '<div class="monad-card" style="padding:0.6rem;margin-bottom:0.3rem;">'
+    "<strong>{title:.90}</strong><br>"
+    "<span style='color:#A3A3A3;font-size:0.75rem;'>r/{subreddit} • {age}</span>"
+    "</div>"
+)
+_NEWS_PREVIEW_TPL = (
+    '<div class="monad-card" style="padding:0.6rem;margin-bottom:0.3rem;">'
+    "<strong>{title:.90}</strong><br>"
+    "<span style='color:#A3A3A3;font-size:0.75rem;'>{source} • {age}</span>"
+    "</div>"
+)
+_NEWS_DEFAULTS = {"source": "News"}
+
+
+def _reddit_card(p: dict) -> str:
+    """One Reddit card; upvotes are pre-formatted since a missing/null count renders as nothing."""
+    upvotes = p.get("upvotes")
+    return _REDDIT_TPL.format_map(ChainMap({"upvotes": f"⬆ {upvotes:,}" if upvotes is not None else ""}, p))
+
+
+def _sentiment_engine():
+    """ai_engine.sentiment_engine, imported on first Analyze rather than at startup."""
+    from ai_engine import sentiment_engine
+    return sentiment_engine
+
+
+def _blockchain():
+    """ai_engine.blockchain, imported on first use so web3 stays off the first paint."""
+    from ai_engine import blockchain
+    return blockchain
+
+
+@st.cache_resource(show_spinner=False)
+def _tx_executor() -> ThreadPoolExecutor:
+    """
+    Background worker for push_onchain, so waiting on a receipt never blocks a rerun.
+    One worker: every session signs with the same PRIVATE_KEY, so pushes must run
+    one at a time or concurrent ones would read the same nonce.
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="push_onchain")
+
+
+@st.fragment(run_every=1.5)
+def _poll_pending_tx() -> None:
+    """Show the in-flight push and, once it settles, record the outcome and rerun the app."""
+    future = st.session_state.pending_tx
+    if future is None:
+        return
+    if not future.done():
+        st.info("⏳ Pushing to Monad...")
+        return
+    st.session_state.pending_tx = None
+    try:
+        st.session_state.last_tx_hash = future.result()
+        st.session_state.tx_notice = ("confirmed", st.session_state.last_tx_hash)
+    except Exception as e:
+        st.session_state.tx_notice = ("failed", str(e))
+    st.rerun()
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_connection() -> dict:
+    """check_connection(), reused across reruns for 15s instead of one RPC per rerun."""
+    return _blockchain().check_connection()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_fetch_all(token: str) -> dict:
+    """fetch_all(), reused for 60s per token — feeds turn over on a minute scale at best."""
+    return fetch_all(token)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_fetch_by_query(query: str) -> dict:
+    """fetch_by_query(), reused for 60s per query."""
+    return fetch_by_query(query)
+
+
+def _live_fetch_all(token: str) -> dict:
+    """_cached_fetch_all(), evicting results where a source failed so the next click retries."""
+    data = _cached_fetch_all(token)
+    if not (data["reddit_ok"] and data["cryptopanic_ok"]):
+        _cached_fetch_all.clear(token)
+    return data
+
+
+def _live_fetch_by_query(query: str) -> dict:
+    """_cached_fetch_by_query(), evicting results where a source failed so the next click retries."""
+    data = _cached_fetch_by_query(query)
+    if not (data["reddit_ok"] and data["cryptopanic_ok"]):
+        _cached_fetch_by_query.clear(query)
+    return data
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_analyze(texts: tuple[str, ...]) -> dict:
+    """analyze_sentiment_detailed(), memoized on the exact input texts (real results only, see caller)."""
+    return _sentiment_engine().analyze_sentiment_detailed(list(texts))
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _breakdown_df(breakdown: list[dict]) -> pd.DataFrame:
+    """Per-signal breakdown table, built column-wise and cached on its content."""
+    df = pd.DataFrame.from_records(breakdown)
+    return pd.DataFrame({
+        "": df["label"].eq("POSITIVE").map({True: "🟢", False: "🔴"}),
+        "Text": df["text"],
+        "Confidence": df["confidence"].map("{:.1%}".format),
+        "Score": df["contribution"].map("{:+.4f}".format),
+    })
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _history_df(history: tuple) -> pd.DataFrame:
+    """History as a DataFrame — rebuilt only when a new point is appended."""
+    return pd.DataFrame(list(history))
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _score_chart(history: tuple) -> alt.Chart:
+    """Score-over-time line chart, with its Vega-Lite spec built once per history state."""
+    return alt.Chart(_history_df(history)).mark_line(color="#7C52FF").encode(
+        x=alt.X("timestamp:O", sort=None, title="timestamp"),
+        y=alt.Y("score:Q", title="score"),
+    )
+
+
 # ── Header ────────────────────────────────────────────────────────────
 
 st.markdown('<div class="hero-title">🟣 SentimentFi</div>', unsafe_allow_html=True)
@@ -312,24 +278,9 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# Connection status (non-blocking)
-try:
-    conn = check_connection()
-    if conn["connected"]:
-        st.markdown(
-            f'<span class="monad-badge">⚡ Connected to Monad • Chain {conn["chain_id"]} • Block #{conn["latest_block"]}</span>',
-            unsafe_allow_html=True,
-        )
-    else:
-        st.markdown(
-            '<span class="monad-badge" style="background:rgba(239,68,68,0.15);color:#EF4444;">⚠️ Monad RPC offline — UI still functional</span>',
-            unsafe_allow_html=True,
-        )
-except Exception:
-    st.markdown(
-        '<span class="monad-badge" style="background:rgba(239,68,68,0.15);color:#EF4444;">⚠️ RPC check skipped</span>',
-        unsafe_allow_html=True,
-    )
+# Connection status — filled in at the end of the script (see below), so
+# importing web3 and the RPC round trip don't hold up the main layout
+_conn_badge = st.empty()
 
 st.markdown("---")
 
@@ -338,11 +289,17 @@ st.markdown("---")
 col_left, col_right = st.columns([3, 2], gap="large")
 
 with col_left:
+    # Read session state once per rerun; _ld / _qr are rebound whenever a fetch below replaces them
+    # (the custom query persists via the text input's key)
+    _custom_q = st.session_state.get("custom_query_input", "").strip()
+    _ld = st.session_state.live_data
+    _qr = st.session_state.query_results
+
     # ── Token Selection ───────────────────────────────────────────────
     st.markdown("### 🎯 Select Token")
     token = st.selectbox(
         "Choose a token to analyze",
-        options=["MONAD", "BTC", "ETH"],
+        options=TOKENS,
         label_visibility="collapsed",
     )
 
@@ -351,31 +308,29 @@ with col_left:
 
     col_fetch, col_status = st.columns([2, 1])
     with col_fetch:
-        # Read any custom query the user may have typed (persisted via key)
-        _custom_q = st.session_state.get("custom_query_input", "").strip()
         _btn_label = f"🔎 Search '{_custom_q}'" if _custom_q else "🔄 Fetch Live Data"
         if st.button(_btn_label, use_container_width=True, key="fetch_btn"):
             if _custom_q:
                 with st.spinner(f"Searching Reddit + News for '{_custom_q}'..."):
-                    data = fetch_by_query(_custom_q)
+                    data = _live_fetch_by_query(_custom_q)
                     data["_searched"] = True
-                    st.session_state.query_results = data
+                    data["_query"] = _custom_q
+                    st.session_state.query_results = _qr = data
                     st.session_state.live_texts = data["combined_texts"]
-                    st.session_state.live_data = data
+                    st.session_state.live_data = _ld = data
             else:
                 with st.spinner(f"Fetching live data for {token}..."):
-                    data = fetch_all(token)
-                    st.session_state.live_data = data
+                    data = _live_fetch_all(token)
+                    st.session_state.live_data = _ld = data
                     st.session_state.live_texts = data["combined_texts"]
     with col_status:
-        if st.session_state.live_data:
-            d = st.session_state.live_data
-            r_status = "🟢" if d["reddit_ok"] else "🔴"
-            c_status = "🟢" if d["cryptopanic_ok"] else "🔴"
+        if _ld:
+            r_status = "🟢" if _ld["reddit_ok"] else "🔴"
+            c_status = "🟢" if _ld["cryptopanic_ok"] else "🔴"
             st.markdown(
                 f'<div class="monad-card" style="padding:0.6rem;font-size:0.8rem;">'  
                 f"{r_status} Reddit &nbsp;|&nbsp; {c_status} CryptoPanic<br>"
-                f"<strong>{d['total']}</strong> signals loaded"
+                f"<strong>{_ld['total']}</strong> signals loaded"
                 f"</div>",
                 unsafe_allow_html=True,
             )
@@ -383,7 +338,7 @@ with col_left:
     tab_reddit, tab_cp, tab_custom = st.tabs(["🔴 Reddit", "📰 News", "✏️ Custom Input"])
 
     with tab_reddit:
-        reddit_posts = st.session_state.live_data.get("reddit", [])
+        reddit_posts = _ld.get("reddit", [])
         if not reddit_posts:
             st.markdown(
                 '<div class="monad-card" style="text-align:center;color:#A3A3A3;">'
@@ -392,18 +347,14 @@ with col_left:
                 unsafe_allow_html=True,
             )
         else:
-            for p in reddit_posts:
-                upvotes = f"⬆ {p['upvotes']:,}" if p.get("upvotes") is not None else ""
-                st.markdown(
-                    f'<div class="monad-card" style="padding:0.75rem;margin-bottom:0.4rem;">'
-                    f"<strong>{p['title']}</strong><br>"
-                    f"<span style='color:#A3A3A3;font-size:0.75rem;'>r/{p['subreddit']} &nbsp;•&nbsp; {p['age']} &nbsp;•&nbsp; {upvotes}</span>"
-                    f"</div>",
-                    unsafe_allow_html=True,
-                )
+            # One markdown element for the whole list instead of one per post
+            st.markdown(
+                "".join(map(_reddit_card, reddit_posts)),
+                unsafe_allow_html=True,
+            )
 
     with tab_cp:
-        cp_posts = st.session_state.live_data.get("cryptopanic", [])
+        cp_posts = _ld.get("cryptopanic", [])
         if not cp_posts:
             st.markdown(
                 '<div class="monad-card" style="text-align:center;color:#A3A3A3;">'
@@ -412,14 +363,10 @@ with col_left:
                 unsafe_allow_html=True,
             )
         else:
-            for p in cp_posts:
-                st.markdown(
-                    f'<div class="monad-card" style="padding:0.75rem;margin-bottom:0.4rem;">'
-                    f"<strong>{p['title']}</strong><br>"
-                    f"<span style='color:#A3A3A3;font-size:0.75rem;'>{p.get('source','News')} &nbsp;•&nbsp; {p['age']}</span>"
-                    f"</div>",
-                    unsafe_allow_html=True,
-                )
+            st.markdown(
+                "".join(_NEWS_TPL.format_map(ChainMap(p, _NEWS_DEFAULTS)) for p in cp_posts),
+                unsafe_allow_html=True,
+            )
 
     with tab_custom:
         st.markdown(
@@ -436,33 +383,20 @@ with col_left:
             key="custom_query_input",
         )
         # Show results from last query fetch
-        qr = st.session_state.query_results
-        if qr.get("total", 0) > 0:
-            r_ok = "🟢" if qr["reddit_ok"] else "🔴"
-            n_ok = "🟢" if qr["cryptopanic_ok"] else "🔴"
+        if _qr.get("total", 0) > 0:
+            r_ok = "🟢" if _qr["reddit_ok"] else "🔴"
+            n_ok = "🟢" if _qr["cryptopanic_ok"] else "🔴"
             st.caption(
-                f"{r_ok} Reddit: {len(qr['reddit'])} posts  |  "
-                f"{n_ok} News: {len(qr['cryptopanic'])} articles  |  "
-                f"Total: {qr['total']} signals"
+                f"{r_ok} Reddit: {len(_qr['reddit'])} posts  |  "
+                f"{n_ok} News: {len(_qr['cryptopanic'])} articles  |  "
+                f"Total: {_qr['total']} signals"
             )
             with st.expander("📝 Preview fetched signals", expanded=False):
-                for p in qr["reddit"][:4]:
-                    st.markdown(
-                        f'<div class="monad-card" style="padding:0.6rem;margin-bottom:0.3rem;">'
-                        f"<strong>{p['title'][:90]}</strong><br>"
-                        f"<span style='color:#A3A3A3;font-size:0.75rem;'>r/{p['subreddit']} • {p['age']}</span>"
-                        f"</div>",
-                        unsafe_allow_html=True,
-                    )
-                for p in qr["cryptopanic"][:4]:
-                    st.markdown(
-                        f'<div class="monad-card" style="padding:0.6rem;margin-bottom:0.3rem;">'
-                        f"<strong>{p['title'][:90]}</strong><br>"
-                        f"<span style='color:#A3A3A3;font-size:0.75rem;'>{p.get('source','News')} • {p['age']}</span>"
-                        f"</div>",
-                        unsafe_allow_html=True,
-                    )
-        elif qr.get("_searched"):
+                preview = [_REDDIT_PREVIEW_TPL.format_map(p) for p in _qr["reddit"][:4]] + [
+                    _NEWS_PREVIEW_TPL.format_map(ChainMap(p, _NEWS_DEFAULTS)) for p in _qr["cryptopanic"][:4]
+                ]
+                st.markdown("".join(preview), unsafe_allow_html=True)
+        elif _qr.get("_searched"):
             st.warning("No results found for that query. Try broader keywords.")
 
     # ── Analyze Button ────────────────────────────────────────────────
@@ -474,14 +408,18 @@ with col_left:
         if st.button("🔍 Analyze Sentiment", use_container_width=True, key="analyze_btn"):
             with st.spinner("Running AI sentiment analysis..."):
                 # Priority: custom query → live fetched token data → error
-                _q = st.session_state.get("custom_query_input", "").strip()
-                if _q:
-                    with st.spinner(f"Searching Reddit + News for '{_q}'..."):
-                        qdata = fetch_by_query(_q)
-                        qdata["_searched"] = True
-                        st.session_state.query_results = qdata
-                        st.session_state.live_texts = qdata["combined_texts"]
-                        st.session_state.live_data = qdata
+                if _custom_q:
+                    if _qr.get("_query") == _custom_q and _qr.get("combined_texts"):
+                        # Already fetched via the Search button — don't hit the APIs again
+                        qdata = _qr
+                    else:
+                        with st.spinner(f"Searching Reddit + News for '{_custom_q}'..."):
+                            qdata = _live_fetch_by_query(_custom_q)
+                            qdata["_searched"] = True
+                            qdata["_query"] = _custom_q
+                            st.session_state.query_results = qdata
+                            st.session_state.live_texts = qdata["combined_texts"]
+                            st.session_state.live_data = qdata
                     texts = qdata["combined_texts"]
                     if not texts:
                         st.warning("No results found for that query. Try broader keywords.")
@@ -493,7 +431,11 @@ with col_left:
                 if not texts:
                     st.error("No data to analyze! Enter a search topic above, or click 🔄 Fetch Live Data first.")
                 else:
-                    detail = analyze_sentiment_detailed(texts)
+                    detail = _cached_analyze(tuple(texts))
+                    if not detail["breakdown"]:
+                        # Inference failed and the engine fell back to a neutral
+                        # score — drop it so the next click retries
+                        _cached_analyze.clear(tuple(texts))
                     score = detail["score"]
                     st.session_state.last_score = score
                     st.session_state.last_detail = detail
@@ -519,28 +461,42 @@ with col_left:
                     )
 
     with col_btn2:
-        if st.button("⛓️ Push Onchain", use_container_width=True, key="push_btn"):
+        if st.button(
+            "⛓️ Push Onchain",
+            use_container_width=True,
+            key="push_btn",
+            disabled=st.session_state.pending_tx is not None,
+        ):
             if st.session_state.last_score is None:
                 st.error("Analyze sentiment first!")
             else:
-                with st.spinner("Pushing to Monad..."):
-                    try:
-                        tx_hash = push_onchain(token, st.session_state.last_score)
-                        st.session_state.last_tx_hash = tx_hash
-                        explorer_url = get_explorer_url(tx_hash)
-
-                        st.success("✅ Transaction confirmed on Monad!")
-                        st.markdown(
-                            f'<div class="monad-card-glow">'
-                            f"<strong>Tx Hash:</strong><br>"
-                            f"<code>{tx_hash}</code><br><br>"
-                            f'<a href="{explorer_url}" target="_blank">'
-                            f"🔗 View on Monad Explorer →</a>"
-                            f"</div>",
-                            unsafe_allow_html=True,
-                        )
-                    except Exception as e:
-                        st.error(f"Transaction failed: {e}")
+                # Submit and return — the receipt wait runs on _tx_executor
+                # while _poll_pending_tx checks back every 1.5s
+                st.session_state.pending_tx = _tx_executor().submit(
+                    _blockchain().push_onchain, token, st.session_state.last_score
+                )
+                st.rerun()  # redraw with the button disabled while the push is in flight
+
+        if st.session_state.pending_tx is not None:
+            _poll_pending_tx()
+
+        notice = st.session_state.tx_notice
+        st.session_state.tx_notice = None
+        if notice and notice[0] == "failed":
+            st.error(f"Transaction failed: {notice[1]}")
+        elif notice:
+            tx_hash = notice[1]
+            explorer_url = _blockchain().get_explorer_url(tx_hash)
+            st.success("✅ Transaction confirmed on Monad!")
+            st.markdown(
+                f'<div class="monad-card-glow">'
+                f"<strong>Tx Hash:</strong><br>"
+                f"<code>{tx_hash}</code><br><br>"
+                f'<a href="{explorer_url}" target="_blank">'
+                f"🔗 View on Monad Explorer →</a>"
+                f"</div>",
+                unsafe_allow_html=True,
+            )
 
 
 with col_right:
@@ -571,15 +527,8 @@ with col_right:
 
             with st.expander("🔬 Per-signal breakdown", expanded=False):
                 st.caption(f"Model: `{detail['model']}`")
-                rows = []
-                for item in detail["breakdown"]:
-                    rows.append({
-                        "": "🟢" if item["label"] == "POSITIVE" else "🔴",
-                        "Text": item["text"],
-                        "Confidence": f"{item['confidence']:.1%}",
-                        "Score": f"{item['contribution']:+.4f}",
-                    })
-                st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+                if detail["breakdown"]:
+                    st.dataframe(_breakdown_df(detail["breakdown"]), use_container_width=True, hide_index=True)
     else:
         st.markdown(
             '<div class="monad-card-glow">'
@@ -595,7 +544,7 @@ with col_right:
 
     if st.button("📖 Read & Verify Onchain", use_container_width=True, key="read_btn"):
         try:
-            onchain_score = read_sentiment(token)
+            onchain_score = _blockchain().read_sentiment(token)
             if st.session_state.last_score is not None:
                 ai_score = st.session_state.last_score
                 drift = abs(ai_score - onchain_score)
@@ -611,11 +560,20 @@ with col_right:
         except Exception as e:
             st.error(f"Read failed: {e}")
 
+    if st.button("📚 Read All Tokens Onchain", use_container_width=True, key="read_all_btn"):
+        try:
+            # One batched JSON-RPC request for every token
+            onchain_scores = _blockchain().read_sentiments_batch(TOKENS)
+            for col, (tok, tok_score) in zip(st.columns(len(onchain_scores)), onchain_scores.items()):
+                col.metric(f"{tok} Onchain", f"{tok_score:+.2f}", delta=f"raw: {int(tok_score*100)}")
+        except Exception as e:
+            st.error(f"Read failed: {e}")
+
     # ── Transaction Info ──────────────────────────────────────────────
     if st.session_state.last_tx_hash:
         st.markdown("### 🧾 Last Transaction")
         tx = st.session_state.last_tx_hash
-        url = get_explorer_url(tx)
+        url = _blockchain().get_explorer_url(tx)
         st.markdown(
             f'<div class="monad-card">'
             f"<strong>Hash:</strong><br>"
@@ -631,15 +589,13 @@ st.markdown("---")
 st.markdown("### 📊 Sentiment History")
 
 if st.session_state.sentiment_history:
-    df = pd.DataFrame(st.session_state.sentiment_history)
+    history = tuple(st.session_state.sentiment_history)
+    df = _history_df(history)
 
     col_chart, col_table = st.columns([2, 1])
 
     with col_chart:
-        st.line_chart(
-            df.set_index("timestamp")["score"],
-            color="#7C52FF",
-        )
+        st.altair_chart(_score_chart(history), use_container_width=True)
 
     with col_table:
         show_cols = [c for c in ["timestamp", "token", "score", "confidence", "bullish", "bearish"] if c in df.columns]
@@ -666,3 +622,23 @@ st.markdown(
     "</div>",
     unsafe_allow_html=True,
 )
+
+# ── Connection Status ─────────────────────────────────────────────────
+
+try:
+    conn = _cached_connection()
+    if conn["connected"]:
+        _conn_badge.markdown(
+            f'<span class="monad-badge">⚡ Connected to Monad • Chain {conn["chain_id"]} • Block #{conn["latest_block"]}</span>',
+            unsafe_allow_html=True,
+        )
+    else:
+        _conn_badge.markdown(
+            '<span class="monad-badge" style="background:rgba(239,68,68,0.15);color:#EF4444;">⚠️ Monad RPC offline — UI still functional</span>',
+            unsafe_allow_html=True,
+        )
+except Exception:
+    _conn_badge.markdown(
+        '<span class="monad-badge" style="background:rgba(239,68,68,0.15);color:#EF4444;">⚠️ RPC check skipped</span>',
+        unsafe_allow_html=True,
+    )